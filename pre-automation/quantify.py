@@ -16,12 +16,8 @@ def setup(current_file):
     logger = logging.getLogger(__name__)
 
     # Paths
-    path_repo_root = os.path.dirname(
-        os.path.abspath(os.path.realpath(__file__))
-    )
+    path_repo_root = os.path.dirname(os.path.realpath(__file__))
     path_dotenv = os.path.join(path_repo_root, ".env")
-    path_work_dir = os.path.dirname(
-        os.path.abspath(os.path.realpath(current_file))
-    )
+    path_work_dir = os.path.dirname(os.path.realpath(current_file))
 
     return path_repo_root, path_work_dir, path_dotenv, datetime_today, logger